@@ -13,6 +13,10 @@ from infrastructure.communication.drone_status_buffer import DroneStatusBuffer
 from infrastructure.communication.webrtc_content_streamer import WebRTCConfig, WebRTCContentStreamer
 from infrastructure.vision.pose_buffer import PoseBuffer
 
+TELEMETRY_MAX_WAITING_PERIOD_S = 1.0
+DRONE_TELEMETRY_TTL_S = 0.2
+UAV_POSE_MAX_AGE_S = 0.5
+
 
 class DroneAutolandingService:
     def __init__(self, drone: Drone, tracker: TrackingService, content_streamer_config: WebRTCConfig):
@@ -24,19 +28,33 @@ class DroneAutolandingService:
         self.content_streamer = WebRTCContentStreamer(self.frame_buffer, content_streamer_config)
         self._threads: dict[str, Thread] = dict()
         self._tracking_started: bool = False
+        self._drone_telemetry: Optional[dict[str, Any]] = None
+        self._drone_telemetry_time: float = 0.0
 
     def _tracking_target_loop(self):
         waiting_period = 1.0 / max(1, self.aruco_tracker.camera.get_fps())
+        tracking_failed = False
 
         while self._tracking_started:
             start_time = time.monotonic()
 
-            vis, tracking_result = self.aruco_tracker.track_target()
-            self.frame_buffer.set_value(vis, tracking_result.to_dict())
-            self.pose_buffer.set_value(tracking_result.pose)
-
-            uav_pose = self._to_uav_pose(tracking_result.pose)
-            self.pose_buffer.set_uav_pose_value(uav_pose)
+            try:
+                # Overlays are only useful to someone watching the stream.
+                vis, tracking_result = self.aruco_tracker.track_target(
+                    draw_overlays=self.content_streamer.has_viewers()
+                )
+            except Exception as e:
+                # Without a fresh pose, the landing loop must stop sending the last one.
+                self.pose_buffer.set_poses(None, None)
+                if not tracking_failed:
+                    logger.error("Target tracking failed: {}", e)
+                    tracking_failed = True
+            else:
+                if tracking_failed:
+                    logger.info("Target tracking resumed")
+                    tracking_failed = False
+                self.frame_buffer.set_value(vis, tracking_result.to_dict())
+                self.pose_buffer.set_poses(tracking_result.pose, tracking_result.uav_pose)
 
             end_time = time.monotonic()
             elapsed_time = end_time - start_time
@@ -46,59 +64,67 @@ class DroneAutolandingService:
                 time.sleep(remaining_time)
 
     def _telemetry_loop(self):
-        waiting_period = 1.0 / max(1, self.aruco_tracker.camera.get_fps())
+        frame_version = 0
 
         while self._tracking_started:
-            start_time = time.monotonic()
-
-            self.content_streamer.send_data(self._build_telemetry_payload())
+            # Woken up by the tracking loop on each new result instead of polling at the camera rate.
+            version, _frame, tracking_metadata = self.frame_buffer.wait_for_value(
+                newer_than=frame_version, timeout=TELEMETRY_MAX_WAITING_PERIOD_S
+            )
+            # Timed out: nothing new to report, and resending the last result would pass it off as live.
+            if version == frame_version:
+                continue
+            frame_version = version
 
-            end_time = time.monotonic()
-            elapsed_time = end_time - start_time
-            remaining_time = waiting_period - elapsed_time
+            if not self.content_streamer.has_viewers():
+                continue
 
-            if remaining_time > 0:
-                time.sleep(remaining_time)
+            self.content_streamer.send_data(self._build_telemetry_payload(tracking_metadata))
 
-    def _build_telemetry_payload(self) -> dict[str, Any]:
-        _frame, tracking_metadata = self.frame_buffer.get_value()
+    def _build_telemetry_payload(self, tracking_metadata: Optional[dict[str, Any]]) -> dict[str, Any]:
         payload: dict[str, Any] = dict(tracking_metadata or {})
 
-        drone_status = self.drone_status_buffer.get_value()
-        if drone_status is not None:
-            payload["drone"] = asdict(drone_status)
+        drone_telemetry = self._get_drone_telemetry()
+        if drone_telemetry is not None:
+            payload["drone"] = drone_telemetry
 
         return payload
 
-    @staticmethod
-    def _to_uav_pose(estimated_pose: Optional[Pose3D]) -> Optional[Pose3D]:
-        if estimated_pose is None:
-            return None
+    def _get_drone_telemetry(self) -> Optional[dict[str, Any]]:
+        # Telemetry is sent for every tracking result, but the status is only worth re-serializing a few times
+        # per second.
+        now = time.monotonic()
+        if self._drone_telemetry is None or now - self._drone_telemetry_time >= DRONE_TELEMETRY_TTL_S:
+            drone_status = self.drone_status_buffer.get_value()
+            self._drone_telemetry = None if drone_status is None else asdict(drone_status)
+            self._drone_telemetry_time = now
 
-        return Pose3D(
-            x=-estimated_pose.y,
-            y=estimated_pose.x,
-            z=estimated_pose.z,
-        )
+        return self._drone_telemetry
 
     def _landing_target_loop(self):
         try:
             self.drone.activate_land_mode()
         except Exception as e:
-            logger.warning(f"Could not activate LAND mode: {e}")
+            logger.warning("Could not activate LAND mode: {}", e)
+
+        target = self.aruco_tracker.get_target()
+        target_size = target.length, target.length
+        last_mode = None
 
         while self._tracking_started:
             drone_status = self.drone.get_status()
             self.drone_status_buffer.set_value(drone_status)
-            # logger.info(f"Drone status: {drone_status}")
 
-            uav_pose = self.pose_buffer.get_uav_pose_value()
+            # Log on mode changes only: this loop runs once per received MAVLink message.
+            if drone_status.mode != last_mode:
+                logger.info("Drone mode: {}", drone_status.mode.value)
+                last_mode = drone_status.mode
+
+            # A pose the tracking loop has not refreshed lately (camera stalled) is not a target anymore.
+            uav_pose = self.pose_buffer.get_fresh_uav_pose_value(UAV_POSE_MAX_AGE_S)
             if uav_pose is not None:
                 altitude_to_use = drone_status.relative_altitude if drone_status.relative_altitude > 4.5 else uav_pose.z
                 new_uav_pose = Pose3D(x=uav_pose.x, y=uav_pose.y, z=altitude_to_use)
-                # logger.info(f"UAV pose sent is {new_uav_pose}")
-                target = self.aruco_tracker.get_target()
-                target_size = target.length, target.length
                 self.drone.land_on_target(new_uav_pose, target_size)
 
     def track_target(self):
@@ -41,11 +41,13 @@ class TrackingService:
             z=estimated_pose.z,
         )
 
-    def track_target(self) -> Tuple[np.ndarray, TrackingResult]:
+    def track_target(self, draw_overlays: bool = True) -> Tuple[np.ndarray, TrackingResult]:
         """
         Capture one frame, detect markers, estimate pose for the first matching marker.
         Returns a TrackingResult (DETECTED / NOT_FOUND).
 
+        The detected marker and its axes are drawn on the returned frame only if `draw_overlays` is set.
+
         Raises:
             - domain errors if calibration/target invalid (already validated on construction),
             - infra exceptions if camera/detector fails unexpectedly.
@@ -61,10 +63,15 @@ class TrackingService:
             corners=corners, marker_length_m=self.target.length, calib=self.calibration, center=True
         )
 
-        FrameManipulationTool.draw_detected_markers(frame, [corners], np.array([[marker_id]], dtype=np.int32))
-        FrameManipulationTool.draw_axes_for_poses(
-            frame, self.calibration.camera_matrix, self.calibration.dist_coeffs, rotation_vectors, translation_vectors
-        )
+        if draw_overlays:
+            FrameManipulationTool.draw_detected_markers(frame, [corners], np.array([[marker_id]], dtype=np.int32))
+            FrameManipulationTool.draw_axes_for_poses(
+                frame,
+                self.calibration.camera_matrix,
+                self.calibration.dist_coeffs,
+                rotation_vectors,
+                translation_vectors,
+            )
 
         return frame, TrackingResult.detected(pose=pose, marker_id=marker_id, uav_pose=self._to_uav_pose(pose))
 
@@ -19,3 +19,14 @@ class Camera(ABC):
     @abstractmethod
     def get_fps(self) -> int:
         raise NotImplementedError()
+
+    def grab(self) -> bool:
+        """
+        Acquire the next frame without decoding it. Adapters that cannot split acquisition from decoding
+        keep this default and do all the work in retrieve().
+        """
+        return True
+
+    def retrieve(self) -> np.ndarray:
+        """Decode and return the last grabbed frame."""
+        return self.get_frame()
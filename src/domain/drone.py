@@ -70,6 +70,16 @@ class Drone(ABC):
     def connect(self):
         raise NotImplementedError()
 
+    def disconnect(self) -> None:
+        """Release the link to the drone. Safe to call when not connected."""
+        pass
+
+    def __enter__(self) -> "Drone":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disconnect()
+
     @abstractmethod
     def get_status(self) -> DroneStatus:
         raise NotImplementedError()
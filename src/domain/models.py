@@ -19,7 +19,7 @@ class Pose3D:
 
     def __post_init__(self) -> None:
         for name, v in (("x", self.x), ("y", self.y), ("z", self.z)):
-            if not np.isfinite(v):
+            if not math.isfinite(v):
                 raise InvalidPoseError(f"Pose3D.{name} must be finite, got {v}")
 
     def to_dict(self) -> dict[str, float | None]:
@@ -62,6 +62,11 @@ class CalibrationData:
         if not np.all(np.isfinite(d)):
             raise InvalidCalibrationError("dist_coeffs contains non-finite values")
 
+        # Stored the way OpenCV consumes them, so the pose estimation and drawing calls made for every frame
+        # do not convert them again.
+        object.__setattr__(self, "camera_matrix", np.ascontiguousarray(k, dtype=np.float64))
+        object.__setattr__(self, "dist_coeffs", np.ascontiguousarray(d, dtype=np.float64))
+
 
 @dataclass(frozen=True, slots=True)
 class TargetedMarker:
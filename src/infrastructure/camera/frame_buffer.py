@@ -1,4 +1,4 @@
-from threading import Lock
+from threading import Condition, Lock
 from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
@@ -9,16 +9,38 @@ from domain.buffer import Buffer
 class FrameBuffer(Buffer):
     def __init__(self) -> None:
         self.lock = Lock()
+        self._updated = Condition(self.lock)
         self._frame: Optional[np.ndarray] = None
         self._metadata: Optional[Dict[str, Any]] = None
+        self._version = 0
+        self._closed = False
 
     def set_value(self, frame: np.ndarray, metadata: Optional[Dict[str, Any]] = None) -> None:
-        with self.lock:
+        with self._updated:
             self._frame = frame
             self._metadata = metadata
+            self._version += 1
+            self._updated.notify_all()
 
     def get_value(self) -> Tuple[Optional[np.ndarray], Optional[Dict[str, Any]]]:
         with self.lock:
             if self._frame is None:
                 return None, None
             return self._frame, self._metadata
+
+    def wait_for_value(
+        self, newer_than: int = 0, timeout: Optional[float] = None
+    ) -> Tuple[int, Optional[np.ndarray], Optional[Dict[str, Any]]]:
+        """
+        Block until a value newer than `newer_than` is set, the buffer is closed, or `timeout` expires.
+        :return: (version, frame, metadata). Pass the returned version back to wait for the next value.
+        """
+        with self._updated:
+            self._updated.wait_for(lambda: self._closed or self._version > newer_than, timeout)
+            return self._version, self._frame, self._metadata
+
+    def close(self) -> None:
+        """Release the threads blocked in wait_for_value(); later waits return immediately."""
+        with self._updated:
+            self._closed = True
+            self._updated.notify_all()
@@ -50,9 +50,29 @@ class OpenCVCamera(Camera):
         if not ok or frame is None:
             raise RuntimeError("Failed to read frame from VideoCapture")
 
+        return self._to_output_format(frame)
+
+    def grab(self) -> bool:
+        if self._cap is None or not self._cap.isOpened():
+            self.open()
+
+        return self._cap.grab()
+
+    def retrieve(self) -> np.ndarray:
+        if self._cap is None or not self._cap.isOpened():
+            raise RuntimeError("VideoCapture is not opened, call grab() first")
+
+        ok, frame = self._cap.retrieve()
+        if not ok or frame is None:
+            raise RuntimeError("Failed to retrieve frame from VideoCapture")
+
+        return self._to_output_format(frame)
+
+    def _to_output_format(self, frame: np.ndarray) -> np.ndarray:
         # frame is BGR. Convert to RGB if you standardize on RGB.
+        # The frame is freshly decoded and owned by us, so swap the channels in place.
         if self.rgb:
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
 
         return frame
 
@@ -9,7 +9,7 @@ NUMBER_OF_MILLISECONDS_IN_ONE_SECOND = 1_000_000
 
 
 class PiCameraAdapter(Camera):
-    def __init__(self, fps: int, width: int = 1280, height: int = 720, rgb: bool = True):
+    def __init__(self, fps: int, width: int = 1280, height: int = 720, rgb: bool = False):
         self._cam = Picamera2()
         self._cam_config = self.__make_config(width=width, height=height, is_rgb_cam=rgb)
         self._cam_controls = self.__make_controls(fps=fps)
@@ -18,9 +18,11 @@ class PiCameraAdapter(Camera):
 
     @staticmethod
     def __make_config(width: int, height: int, is_rgb_cam: bool) -> Dict[str, Any]:
+        # Picamera2 names formats after the little-endian pixel word: "RGB888" is laid out B,G,R in memory
+        # and "BGR888" is R,G,B. Requesting the right one lets the ISP produce the final channel order directly.
         config = {
             "size": (width, height),
-            "format": "RGB888" if is_rgb_cam else "BGR888",
+            "format": "BGR888" if is_rgb_cam else "RGB888",
         }
 
         return config
@@ -0,0 +1,90 @@
+from threading import Thread
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+from domain.camera import Camera
+from infrastructure.camera.frame_buffer import FrameBuffer
+
+FRAME_MAX_WAITING_PERIOD_S = 2.0
+
+
+class ThreadedCamera(Camera):
+    """
+    Camera decorator that captures frames on a background thread.
+
+    The consumer processes a frame while the next one is being acquired. Only the latest frame is kept, so a
+    consumer slower than the camera skips frames instead of lagging behind, and each frame is handed out once.
+    The wrapped camera must return a new array on every get_frame() call.
+    """
+
+    def __init__(self, camera: Camera):
+        self._camera = camera
+        self._frames = FrameBuffer()
+        self._capture_thread: Optional[Thread] = None
+        self._capturing = False
+        self._capture_error: Optional[Exception] = None
+        self._last_version = 0
+
+    def open(self) -> None:
+        if self._capturing:
+            return
+
+        self._camera.open()
+        self._frames = FrameBuffer()
+        self._last_version = 0
+        self._capture_error = None
+        self._capturing = True
+        self._capture_thread = Thread(target=self._capture_loop, name="camera-capture", daemon=True)
+        self._capture_thread.start()
+
+    def close(self) -> None:
+        self._capturing = False
+        self._frames.close()
+        if self._capture_thread is not None:
+            self._capture_thread.join()
+            self._capture_thread = None
+        self._camera.close()
+
+    def get_frame(self) -> np.ndarray:
+        self._raise_capture_error()
+        if not self._capturing:
+            self.open()
+
+        # Like the wrapped cameras, block until a frame comes: a stalled camera is only reported, not an error.
+        waited_s = 0.0
+        while True:
+            version, frame, _metadata = self._frames.wait_for_value(
+                newer_than=self._last_version, timeout=FRAME_MAX_WAITING_PERIOD_S
+            )
+            if version != self._last_version:
+                self._last_version = version
+                return frame
+
+            self._raise_capture_error()
+            if not self._capturing:
+                raise RuntimeError("Camera closed while waiting for a frame.")
+            waited_s += FRAME_MAX_WAITING_PERIOD_S
+            logger.warning("No frame received from the camera for {:.1f} seconds, still waiting", waited_s)
+
+    def get_fps(self) -> int:
+        return self._camera.get_fps()
+
+    def _raise_capture_error(self) -> None:
+        if self._capture_error is not None:
+            raise RuntimeError("Camera capture stopped") from self._capture_error
+
+    def _capture_loop(self) -> None:
+        while self._capturing:
+            try:
+                frame = self._camera.get_frame()
+            except Exception as e:
+                logger.error("Camera capture failed: {}", e)
+                self._capture_error = e
+                self._capturing = False
+                # Wake the consumer now rather than letting it wait out its timeout.
+                self._frames.close()
+                return
+
+            self._frames.set_value(frame)
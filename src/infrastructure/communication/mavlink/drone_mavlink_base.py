@@ -1,8 +1,12 @@
+import atexit
+import errno
 import math
+import random
 import time
 from abc import abstractmethod
 from typing import Optional
 
+from loguru import logger
 from pymavlink import mavutil
 
 from domain.drone import Drone, DroneMode, DroneStatus
@@ -10,6 +14,29 @@ from domain.models import Pose3D
 
 from .mavlink_connection_params import MavlinkConnectionParams
 
+CAMERA_WIDTH_PX = 640
+CAMERA_HEIGHT_PX = 480
+CAMERA_HORIZONTAL_FOV_RAD = math.radians(53.5)
+CAMERA_VERTICAL_FOV_RAD = math.radians(41.41)
+X_ANGLE_PER_PX = CAMERA_HORIZONTAL_FOV_RAD / CAMERA_WIDTH_PX
+Y_ANGLE_PER_PX = CAMERA_VERTICAL_FOV_RAD / CAMERA_HEIGHT_PX
+LANDING_TARGET_IDENTITY_Q = (1.0, 0.0, 0.0, 0.0)
+MAV_MODE_FLAG_SAFETY_ARMED = mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED
+LANDING_TARGET_MIN_PERIOD_S = 0.05
+LANDING_TARGET_ANGLE_EPSILON_RAD = 0.002
+LANDING_TARGET_DISTANCE_EPSILON_M = 0.02
+CONNECT_RETRY_BASE_S = 0.1
+CONNECT_RETRY_CAP_S = 1.0
+CONNECT_RETRY_JITTER = 0.3
+# Device not there yet or held by another process: worth retrying. Anything else (permissions, bad address,
+# port already bound) will not fix itself.
+CONNECT_TRANSIENT_ERRNOS = frozenset({errno.ENOENT, errno.EBUSY, errno.EAGAIN})
+
+
+def _backoff_delay(attempt: int) -> float:
+    delay = min(CONNECT_RETRY_CAP_S, CONNECT_RETRY_BASE_S * 2**attempt)
+    return delay * (1.0 + random.uniform(-CONNECT_RETRY_JITTER, CONNECT_RETRY_JITTER))
+
 
 class DroneMavlinkBase(Drone):
     def __init__(self, params: MavlinkConnectionParams):
@@ -19,6 +46,9 @@ class DroneMavlinkBase(Drone):
         """
         self.parameters = params
         self.connection: Optional[mavutil.mavfile] = None
+        self._landing_target_msg = None
+        self._last_landing_target: tuple[float, float, float] = (0.0, 0.0, 0.0)
+        self._last_landing_target_time = 0.0
         self.status: DroneStatus = DroneStatus(
             DroneMode.UNKNOWN,
             groundspeed_mps=0.0,
@@ -46,39 +76,79 @@ class DroneMavlinkBase(Drone):
         self.status.last_signal_gpio_s = time.time() if now_s is None else float(now_s)
 
     def connect(self) -> None:
-        self._init_mavlink_connection()
-        self._wait_for_heartbeat()
+        # No timeout means waiting for the autopilot for as long as it takes, e.g. when started before it.
+        timeout = self.parameters.timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._open_connection(deadline)
+        # Fallback for callers that do not use the drone as a context manager; unregistered on disconnect().
+        atexit.register(self.disconnect)
+        self._wait_for_heartbeat(deadline)
         self._send_heartbeat()
         self._update_status()
 
+    def disconnect(self) -> None:
+        atexit.unregister(self.disconnect)
+        if self.connection is None:
+            return
+
+        self.connection.close()
+        self.connection = None
+        self._landing_target_msg = None
+
     def get_status(self) -> DroneStatus:
         self._update_status()
         return self.status
 
     def land_on_target(self, uav_pose: Pose3D, target_size: tuple[float, float]) -> None:
-        const = math.pi / 180
-        h_fov, v_fov = 53.5 * const, 41.41 * const
-        x_ang = (uav_pose.x - 640 * 0.5) * h_fov / 640
-        y_ang = (uav_pose.y - 480 * 0.5) * v_fov / 480
+        x_ang = (uav_pose.x - CAMERA_WIDTH_PX * 0.5) * X_ANGLE_PER_PX
+        y_ang = (uav_pose.y - CAMERA_HEIGHT_PX * 0.5) * Y_ANGLE_PER_PX
 
         distance = math.sqrt(uav_pose.x**2 + uav_pose.y**2 + uav_pose.z**2)
 
-        self.connection.mav.landing_target_send(
-            int(time.time() * 1_000_000),  # time_usec
-            0,  # target_num
-            mavutil.mavlink.MAV_FRAME_BODY_FRD,  # frame
-            x_ang,  # angle_x
-            y_ang,  # angle_y
-            distance,  # distance
-            target_size[0],  # size_x
-            target_size[1],  # size_y
-            uav_pose.x,  # x
-            uav_pose.y,  # y
-            uav_pose.z,  # z
-            [1.0, 0.0, 0.0, 0.0],  # q  <-- tableau de 4 floats
-            mavutil.mavlink.LANDING_TARGET_TYPE_VISION_FIDUCIAL,
-            1,  # position_valid
-        )
+        # The landing loop calls this for every received MAVLink message, mostly with the same pose: within the
+        # minimum period, only a target that actually moved is worth sending.
+        now = time.monotonic()
+        last_x_ang, last_y_ang, last_distance = self._last_landing_target
+        if (
+            now - self._last_landing_target_time < LANDING_TARGET_MIN_PERIOD_S
+            and abs(x_ang - last_x_ang) < LANDING_TARGET_ANGLE_EPSILON_RAD
+            and abs(y_ang - last_y_ang) < LANDING_TARGET_ANGLE_EPSILON_RAD
+            and abs(distance - last_distance) < LANDING_TARGET_DISTANCE_EPSILON_M
+        ):
+            return
+
+        # The message is encoded once and its fields are updated in place; send() packs it again each time.
+        msg = self._landing_target_msg
+        if msg is None:
+            msg = self._landing_target_msg = self.connection.mav.landing_target_encode(
+                0,  # time_usec
+                0,  # target_num
+                mavutil.mavlink.MAV_FRAME_BODY_FRD,  # frame
+                0.0,  # angle_x
+                0.0,  # angle_y
+                0.0,  # distance
+                0.0,  # size_x
+                0.0,  # size_y
+                0.0,  # x
+                0.0,  # y
+                0.0,  # z
+                LANDING_TARGET_IDENTITY_Q,  # q  <-- tableau de 4 floats
+                mavutil.mavlink.LANDING_TARGET_TYPE_VISION_FIDUCIAL,
+                1,  # position_valid
+            )
+
+        msg.time_usec = time.time_ns() // 1000
+        msg.angle_x = x_ang
+        msg.angle_y = y_ang
+        msg.distance = distance
+        msg.size_x = target_size[0]
+        msg.size_y = target_size[1]
+        msg.x = uav_pose.x
+        msg.y = uav_pose.y
+        msg.z = uav_pose.z
+        self.connection.mav.send(msg)
+        self._last_landing_target = (x_ang, y_ang, distance)
+        self._last_landing_target_time = now
 
     def activate_land_mode(self) -> None:
         pass
@@ -92,34 +162,34 @@ class DroneMavlinkBase(Drone):
         received_message = self.connection.recv_match(blocking=True)
 
         if received_message:
-
+            # Bound once: this runs for every message received on the link.
+            status = self.status
             message_type: str = received_message.get_type()
 
             if message_type == "HEARTBEAT":
-                self.status.mode = DroneMode.from_str(mavutil.mode_string_v10(received_message))
-                self.status.armed = (received_message.base_mode & mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED) != 0
-                self.status.last_heartbeat_s = time.time()
+                status.mode = DroneMode.from_str(mavutil.mode_string_v10(received_message))
+                status.armed = (received_message.base_mode & MAV_MODE_FLAG_SAFETY_ARMED) != 0
+                status.last_heartbeat_s = time.time()
 
             elif message_type == "VFR_HUD":
-                self.status.alt_m = float(getattr(received_message, "alt", 0.0))
-                self.status.groundspeed_mps = float(getattr(received_message, "groundspeed", 0.0))
+                status.alt_m = float(received_message.alt)
+                status.groundspeed_mps = float(received_message.groundspeed)
 
             elif message_type == "SYS_STATUS":
-                battery_mv = getattr(received_message, "voltage_battery", 0)  # mV
-                self.status.battery_voltage_v = float(battery_mv) / 1000.0
-                self.status.battery_remaining_pct = int(getattr(received_message, "battery_remaining", 0) or 0)
+                status.battery_voltage_v = received_message.voltage_battery / 1000.0  # mV
+                status.battery_remaining_pct = int(received_message.battery_remaining or 0)
 
             elif message_type == "GPS_RAW_INT":
-                self.status.gps_fix_type = int(getattr(received_message, "fix_type", 0) or 0)
+                status.gps_fix_type = int(received_message.fix_type or 0)
 
             elif message_type == "GLOBAL_POSITION_INT":
-                self.status.latitude = float(getattr(received_message, "lat", 0)) / 1e7
-                self.status.longitude = float(getattr(received_message, "lon", 0)) / 1e7
-                self.status.relative_altitude_ms = float(getattr(received_message, "alt", 0)) / 1000.0
-                self.status.relative_altitude = float(getattr(received_message, "relative_alt", 0)) / 1000.0
-                self.status.speed = float(getattr(received_message, "vz", 0)) / 100.0
-                hdg = int(getattr(received_message, "hdg", 65535))
-                self.status.heading_deg = None if hdg == 65535 else hdg / 100.0
+                status.latitude = received_message.lat / 1e7
+                status.longitude = received_message.lon / 1e7
+                status.relative_altitude_ms = received_message.alt / 1000.0
+                status.relative_altitude = received_message.relative_alt / 1000.0
+                status.speed = received_message.vz / 100.0
+                hdg = int(received_message.hdg)
+                status.heading_deg = None if hdg == 65535 else hdg / 100.0
 
     def _send_heartbeat(self):
         self._require_connected()
@@ -132,9 +202,41 @@ class DroneMavlinkBase(Drone):
             mavlink_version=2,
         )
 
-    def _wait_for_heartbeat(self):
+    def _open_connection(self, deadline: Optional[float]) -> None:
+        # The serial device may briefly not exist or be busy (e.g. right after boot): retry with backoff until the
+        # connection timeout instead of failing on the first attempt.
+        attempt = 0
+        while True:
+            try:
+                self._init_mavlink_connection()
+                return
+            except OSError as e:
+                # pyserial's SerialException carries the errno of the failed open().
+                if e.errno not in CONNECT_TRANSIENT_ERRNOS:
+                    raise
+                delay = _backoff_delay(attempt)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    raise RuntimeError(f"Could not open MAVLink connection to {self.parameters.address}: {e}") from e
+                logger.warning(
+                    "Could not open MAVLink connection to {}: {}. Retrying in {:.2f} s",
+                    self.parameters.address,
+                    e,
+                    delay,
+                )
+                time.sleep(delay)
+                attempt += 1
+
+    def _wait_for_heartbeat(self, deadline: Optional[float]) -> None:
         self._require_connected()
-        self.connection.wait_heartbeat()
+        logger.info("Waiting for a heartbeat from {}", self.parameters.address)
+        if deadline is None:
+            self.connection.wait_heartbeat()
+            return
+
+        if self.connection.wait_heartbeat(timeout=max(0.0, deadline - time.monotonic())) is None:
+            raise RuntimeError(
+                f"No heartbeat received from {self.parameters.address} within {self.parameters.timeout} seconds."
+            )
 
     def switch_mode(self, mode: DroneMode) -> None:
         pass
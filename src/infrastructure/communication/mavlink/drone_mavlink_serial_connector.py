@@ -1,3 +1,4 @@
+from loguru import logger
 from pymavlink import mavutil
 
 from .drone_mavlink_base import DroneMavlinkBase
@@ -10,3 +11,18 @@ class DroneMavlinkSerialConnector(DroneMavlinkBase):
 
     def _init_mavlink_connection(self) -> None:
         self.connection = mavutil.mavlink_connection(self.parameters.address, baud=self.parameters.baud_rate)
+        self._enable_low_latency()
+
+    def _enable_low_latency(self) -> None:
+        # USB-UART adapters (FTDI & co.) hold incoming bytes up to 16 ms before handing them to the host;
+        # ASYNC_LOW_LATENCY drops that to ~1 ms. It is Linux-only and not every UART driver supports it, in which
+        # case we keep going.
+        port = getattr(self.connection, "port", None)
+        set_low_latency_mode = getattr(port, "set_low_latency_mode", None)
+        if set_low_latency_mode is None:
+            return
+
+        try:
+            set_low_latency_mode(True)
+        except (ValueError, OSError, NotImplementedError) as e:
+            logger.warning("Could not enable low latency mode on {}: {}", self.parameters.address, e)
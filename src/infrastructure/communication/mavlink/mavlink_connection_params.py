@@ -1,9 +1,10 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass(frozen=True, slots=True)
 class MavlinkConnectionParams:
     address: str
     port: int = 0
-    timeout: float = 10.0
+    timeout: Optional[float] = None  # seconds to wait for the autopilot on connect; None waits indefinitely
     baud_rate: int = 921600
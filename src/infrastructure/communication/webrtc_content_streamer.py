@@ -24,20 +24,21 @@ class _VideoBufferTrack(VideoStreamTrack):
         self._last = 0.0
         self._fh = int(fallback_hw[0])
         self._fw = int(fallback_hw[1])
+        self._fallback_frame = np.zeros((self._fh, self._fw, 3), dtype=np.uint8)
 
     async def recv(self) -> VideoFrame:
-        now = time.time()
+        # Monotonic clock: a wall clock step (NTP/GPS time sync on the Pi) must not stall or burst the stream.
+        now = time.monotonic()
         dt = now - self._last
         if dt < self._period:
             await asyncio.sleep(self._period - dt)
-        self._last = time.time()
+        self._last = time.monotonic()
 
         frame, _meta = self._buf.get_value()
         if frame is None:
-            img = np.zeros((self._fh, self._fw, 3), dtype=np.uint8)
-            vf = VideoFrame.from_ndarray(img, format="bgr24")
-        else:
-            vf = VideoFrame.from_ndarray(frame, format="bgr24")
+            frame = self._fallback_frame
+
+        vf = VideoFrame.from_ndarray(frame, format="bgr24")
 
         vf.pts, vf.time_base = await self.next_timestamp()
         return vf
@@ -65,8 +66,11 @@ class WebRTCContentStreamer(ContentStreamer):
 
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
+    def has_viewers(self) -> bool:
+        return len(self.peer_connections) > 0
+
     def send_data(self, data: Dict[str, Any]) -> None:
-        if self._loop is None:
+        if self._loop is None or not self.telemetry_channels:
             return
         payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
         self._loop.call_soon_threadsafe(self._send_telemetry, payload)
@@ -84,7 +88,9 @@ class WebRTCContentStreamer(ContentStreamer):
         app.router.add_post("/offer", self._offer)
         app.on_shutdown.append(self._shutdown)
 
-        logger.info(f"Starting WebRTCContentStreamer on : http://{self.configuration.host}:{self.configuration.port}")
+        logger.info(
+            "Starting WebRTCContentStreamer on : http://{}:{}", self.configuration.host, self.configuration.port
+        )
         await web._run_app(app, host=self.configuration.host, port=self.configuration.port)
 
     @staticmethod
@@ -145,7 +151,7 @@ class WebRTCContentStreamer(ContentStreamer):
                 channel.send(payload)
             except Exception as e:
                 dead_channels.append(channel)
-                logger.error(f"Failed to send telemetry: {e}")
+                logger.error("Failed to send telemetry: {}", e)
 
         for channel in dead_channels:
             self.telemetry_channels.discard(channel)
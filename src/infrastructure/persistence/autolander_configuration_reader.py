@@ -128,9 +128,13 @@ class AutolanderConfigurationReader:
 
         baud_rate = int(self._require(dc, "baud_rate", "drone_connection"))
 
+        timeout_val = dc.get("timeout", None)
+        timeout: Optional[float] = None if timeout_val is None else float(timeout_val)
+
         return DroneConnectionConfiguration(
             use_serial=use_serial,
             address=address,
             port=port,
             baud_rate=baud_rate,
+            timeout=timeout,
         )
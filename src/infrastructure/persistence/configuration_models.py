@@ -39,6 +39,7 @@ class DroneConnectionConfiguration:
     address: str
     port: Optional[int]
     baud_rate: int
+    timeout: Optional[float] = None
 
 
 @dataclass(slots=True, frozen=True)
@@ -1,5 +1,7 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -17,6 +19,10 @@ class LiveFrameCollectorConfig:
     waitkey_ms: int = 10
     show_overlays: bool = True
     headless: bool = False
+    retrieve_every_n: int = 1  # frames are grabbed every tick but only decoded/displayed every n ticks
+    detect_every_n: int = 3  # markers are detected on every n-th displayed frame (and always on capture)
+    max_frames: Optional[int] = None  # stop after this many grabbed frames (headless runs have no ESC key)
+    max_duration_s: Optional[float] = None  # stop after this many seconds
 
 
 class LiveFrameCollector(FrameCollector):
@@ -42,48 +48,98 @@ class LiveFrameCollector(FrameCollector):
         self.target = target
         self.cfg = cfg
 
+    @staticmethod
+    def _make_banner(captures: int) -> str:
+        return f"Captures: {captures} | 'c' capture | ESC finish"
+
+    def _limit_reached(self, frame_i: int, started_at: float) -> bool:
+        if self.cfg.max_frames is not None and frame_i >= self.cfg.max_frames:
+            return True
+        if self.cfg.max_duration_s is not None and time.monotonic() - started_at >= self.cfg.max_duration_s:
+            return True
+        return False
+
     def collect(self) -> List[np.ndarray]:
         self.camera.open()
 
         frames: List[np.ndarray] = []
         frame_i = 0
+        displayed_i = 0
 
         print("Live calibration capture")
         print("  Press 'c' to capture current frame (if markers detected)")
         print("  Press 'ESC' to finish and calibrate")
 
-        while True:
-            frame = self.camera.get_frame()
-            frame_i += 1
-
-            detections = self.detector.detect(frame, self.target)
-            vis = frame.copy() if self.cfg.show_overlays else frame
-
-            if self.cfg.show_overlays and len(detections) > 0:
-                corners_list = [c for (_mid, c) in detections]
-                ids_arr = np.array([[mid] for (mid, _c) in detections], dtype=np.int32)
-                FrameManipulationTool.draw_detected_markers(vis, corners_list, ids_arr)
-
-            if self.cfg.show_overlays:
-                msg = f"Captures: {len(frames)} | 'c' capture | ESC finish"
-                FrameManipulationTool.write_text_on_frame(vis, msg, Color.BLUE)
-
-            if not self.cfg.headless:
-                cv2.imshow(self.cfg.window_name, vis)
-                key = cv2.waitKey(self.cfg.waitkey_ms) & 0xFF
-            else:
-                key = 255
+        frame: Optional[np.ndarray] = None
+        detections: List[Tuple[int, np.ndarray]] = []
+        pending_detection: Optional[Future] = None
+        capture_requested = False
+        banner = self._make_banner(len(frames))
+        started_at = time.monotonic()
+
+        # Detection runs on a worker thread so that grabbing and display keep going meanwhile. OpenCV releases the
+        # GIL while detecting, and the detector holds native state that could not be shipped to another process.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="marker-detection") as detection_worker:
+            while True:
+                self.camera.grab()
+                frame_i += 1
+
+                # Frames that are neither displayed nor captured are grabbed but never decoded.
+                if capture_requested or frame is None or frame_i % max(1, self.cfg.retrieve_every_n) == 0:
+                    frame = self.camera.retrieve()
+
+                    if pending_detection is not None and pending_detection.done():
+                        detections = pending_detection.result()
+                        pending_detection = None
+
+                    if capture_requested:
+                        # The detector is not shared between threads: let the in-flight detection finish first.
+                        if pending_detection is not None:
+                            pending_detection.result()
+                            pending_detection = None
+                        detections = self.detector.detect(frame, self.target)
+                    elif pending_detection is None and displayed_i % max(1, self.cfg.detect_every_n) == 0:
+                        # The frame gets overlays drawn in place below, so the worker gets its own grayscale image.
+                        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                        pending_detection = detection_worker.submit(self.detector.detect, gray, self.target)
+                    displayed_i += 1
+
+                    # The capture is taken before the overlays are drawn in place, so it stays clean
+                    # without copying every displayed frame.
+                    if capture_requested:
+                        if len(detections) > 0:
+                            print(f"[CAPTURE] frame {frame_i} ({len(detections)} markers)")
+                            frames.append(frame.copy())
+                            banner = self._make_banner(len(frames))
+                        else:
+                            print("[SKIP] no markers detected")
+                        capture_requested = False
+
+                    # Between detections, the latest markers are redrawn on the new frame.
+                    if self.cfg.show_overlays and len(detections) > 0:
+                        ids, corners_list = zip(*detections)
+                        ids_arr = np.fromiter(ids, dtype=np.int32, count=len(ids)).reshape(-1, 1)
+                        FrameManipulationTool.draw_detected_markers(frame, corners_list, ids_arr)
+
+                    if self.cfg.show_overlays:
+                        FrameManipulationTool.write_text_on_frame(frame, banner, Color.BLUE)
+
+                    if not self.cfg.headless:
+                        cv2.imshow(self.cfg.window_name, frame)
+
+                if not self.cfg.headless:
+                    key = cv2.waitKey(self.cfg.waitkey_ms) & 0xFF
+                else:
+                    # No GUI event loop to block on: yield the CPU instead of spinning.
+                    time.sleep(self.cfg.waitkey_ms / 1000.0)
+                    key = 255
 
-            if key == 27:
-                break
+                if key == 27 or self._limit_reached(frame_i, started_at):
+                    break
 
-            # capture
-            if key == ord("c"):
-                if len(detections) > 0:
-                    print(f"[CAPTURE] frame {frame_i} ({len(detections)} markers)")
-                    frames.append(frame.copy())
-                else:
-                    print("[SKIP] no markers detected")
+                # capture on the next retrieved frame
+                if key == ord("c"):
+                    capture_requested = True
 
         if not self.cfg.headless:
             cv2.destroyAllWindows()
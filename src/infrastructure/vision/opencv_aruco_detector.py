@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -12,6 +12,13 @@ from domain.models import TargetedMarker
 class OpenCVArucoDetectorConfig:
     dictionary_id: int = cv2.aruco.DICT_4X4_250
     corner_refinement: bool = True
+    # Defaults are OpenCV's. Narrowing the threshold window range and raising the minimum perimeter
+    # trades recall on tiny/far markers for fewer thresholding passes per frame.
+    adaptive_thresh_win_size_min: int = 3
+    adaptive_thresh_win_size_max: int = 23
+    adaptive_thresh_win_size_step: int = 10
+    min_marker_perimeter_rate: float = 0.03
+    polygonal_approx_accuracy_rate: float = 0.03
 
 
 class OpenCVArucoDetector(MarkerDetector):
@@ -22,18 +29,32 @@ class OpenCVArucoDetector(MarkerDetector):
         params = cv2.aruco.DetectorParameters()
         if cfg.corner_refinement:
             params.cornerRefinementMethod = cv2.aruco.CORNER_REFINE_SUBPIX
+        params.adaptiveThreshWinSizeMin = cfg.adaptive_thresh_win_size_min
+        params.adaptiveThreshWinSizeMax = cfg.adaptive_thresh_win_size_max
+        params.adaptiveThreshWinSizeStep = cfg.adaptive_thresh_win_size_step
+        params.minMarkerPerimeterRate = cfg.min_marker_perimeter_rate
+        params.polygonalApproxAccuracyRate = cfg.polygonal_approx_accuracy_rate
         self._detector = cv2.aruco.ArucoDetector(self._dict, params)
+        self._gray: Optional[np.ndarray] = None
+
+    def _to_gray(self, frame: np.ndarray) -> np.ndarray:
+        if frame.ndim == 2:
+            return frame
+
+        # Detection works on grayscale anyway: convert into a buffer reused from frame to frame.
+        if self._gray is None or self._gray.shape != frame.shape[:2]:
+            self._gray = np.empty(frame.shape[:2], dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return self._gray
 
     def detect(self, frame: np.ndarray, target: TargetedMarker) -> List[Tuple[int, np.ndarray]]:
-        corners, ids, _ = self._detector.detectMarkers(frame)
+        corners, ids, _ = self._detector.detectMarkers(self._to_gray(frame))
         if ids is None or len(ids) == 0:
             return []
 
-        ids_flat = ids.flatten().tolist()
-        results: List[Tuple[int, np.ndarray]] = []
-
-        for marker_id, c in zip(ids_flat, corners):
-            if target.id is None or marker_id == target.id:
-                results.append((int(marker_id), c))
+        ids_flat = ids.ravel()
+        if target.id is None:
+            return [(marker_id, c) for marker_id, c in zip(ids_flat.tolist(), corners)]
 
-        return results
+        # Select the targeted marker with one comparison over the ids array.
+        return [(int(target.id), corners[i]) for i in np.flatnonzero(ids_flat == target.id)]
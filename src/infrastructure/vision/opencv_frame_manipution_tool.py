@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Sequence
 
 import cv2
@@ -21,6 +22,18 @@ class Color(Enum):
         return int(b), int(g), int(r)
 
 
+@lru_cache(maxsize=8)
+def _marker_object_points(marker_length_m: float) -> np.ndarray:
+    """Marker corners in the marker frame, in the order expected by SOLVEPNP_IPPE_SQUARE."""
+    half = marker_length_m / 2.0
+    points = np.array(
+        [[-half, half, 0.0], [half, half, 0.0], [half, -half, 0.0], [-half, -half, 0.0]],
+        dtype=np.float32,
+    )
+    points.setflags(write=False)
+    return points
+
+
 @dataclass(frozen=True, slots=True)
 class TextStyle:
     org: tuple[int, int] = (10, 22)
@@ -88,13 +101,26 @@ class FrameManipulationTool:
     ) -> tuple[np.ndarray, np.ndarray]:
         """
         Returns (rotation_vectors, translation_vectors) with shape (N, 1, 3).
+        Uses the closed-form planar square solver, with the same corner convention as the
+        deprecated cv2.aruco.estimatePoseSingleMarkers.
         """
-        rotation_vectors, translation_vectors, _ = cv2.aruco.estimatePoseSingleMarkers(
-            list(corners),
-            float(marker_length_m),
-            camera_matrix,
-            distortion_coefficients,
-        )
+        object_points = _marker_object_points(float(marker_length_m))
+        image_points = np.asarray(corners, dtype=np.float32).reshape(-1, 4, 2)
+
+        n = len(image_points)
+        rotation_vectors = np.empty((n, 1, 3), dtype=np.float64)
+        translation_vectors = np.empty((n, 1, 3), dtype=np.float64)
+        for i in range(n):
+            _ok, rvec, tvec = cv2.solvePnP(
+                object_points,
+                image_points[i],
+                camera_matrix,
+                distortion_coefficients,
+                flags=cv2.SOLVEPNP_IPPE_SQUARE,
+            )
+            rotation_vectors[i, 0] = rvec.ravel()
+            translation_vectors[i, 0] = tvec.ravel()
+
         return rotation_vectors, translation_vectors
 
     @staticmethod
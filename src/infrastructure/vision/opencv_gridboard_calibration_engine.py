@@ -112,11 +112,13 @@ class OpenCVGridBoardCameraCalibrationEngine(CameraCalibrationEngine):
             h, w = frame.shape[:2]
             img_size = (w, h)
 
-            corners, ids, rejected = self._detector.detectMarkers(frame)
+            # Detection and refinement both work on grayscale: convert once and share it.
+            gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            corners, ids, rejected = self._detector.detectMarkers(gray)
 
             if self._cfg.refine_strategy and ids is not None and len(ids) > 0:
-                corners, ids, rejected, _ = cv2.aruco.refineDetectedMarkers(
-                    image=frame,
+                corners, ids, rejected, _ = self._detector.refineDetectedMarkers(
+                    image=gray,
                     board=self._board,
                     detectedCorners=corners,
                     detectedIds=ids,
@@ -127,27 +129,22 @@ class OpenCVGridBoardCameraCalibrationEngine(CameraCalibrationEngine):
                 continue
 
             all_corners_per_frame.append(corners)
-            all_ids_per_frame.append(ids.copy())
+            all_ids_per_frame.append(ids)
 
         if img_size is None or len(all_ids_per_frame) < 1:
             raise NotEnoughFramesError()
 
-        all_corners_concat: list[np.ndarray] = []
-        all_ids_concat: list[int] = []
-        marker_counter_per_frame: list[int] = []
-
-        for corners_i, ids_i in zip(all_corners_per_frame, all_ids_per_frame):
-            marker_counter_per_frame.append(len(corners_i))
-            for c, mid in zip(corners_i, ids_i.flatten().tolist()):
-                all_corners_concat.append(c)
-                all_ids_concat.append(int(mid))
+        all_corners_concat: list[np.ndarray] = [c for corners_i in all_corners_per_frame for c in corners_i]
+        all_ids_concat_np = np.concatenate(all_ids_per_frame, axis=None).astype(np.int32).reshape(-1, 1)
+        counter_np = np.fromiter(
+            (len(corners_i) for corners_i in all_corners_per_frame),
+            dtype=np.int32,
+            count=len(all_corners_per_frame),
+        ).reshape(-1, 1)
 
         flags, _aspect_ratio, camera_matrix_init = self._flags_and_initial_k()
         dist_coeffs_init = None
 
-        all_ids_concat_np = np.array(all_ids_concat, dtype=np.int32).reshape(-1, 1)
-        counter_np = np.array(marker_counter_per_frame, dtype=np.int32).reshape(-1, 1)
-
         rep_error, camera_matrix, dist_coeffs, *_ = cv2.aruco.calibrateCameraAruco(
             corners=all_corners_concat,
             ids=all_ids_concat_np,
@@ -1,10 +1,10 @@
 from typing import Optional, Tuple
 
-import cv2
 import numpy as np
 
 from domain.models import CalibrationData, Pose3D
 from domain.pose_estimator import PoseEstimator
+from infrastructure.vision.opencv_frame_manipution_tool import FrameManipulationTool
 
 
 class OpenCVPoseEstimator(PoseEstimator):
@@ -18,17 +18,14 @@ class OpenCVPoseEstimator(PoseEstimator):
         else:
             corners_in = corners
 
-        rotation_vecs, translation_vecs, _ = cv2.aruco.estimatePoseSingleMarkers(
+        rotation_vecs, translation_vecs = FrameManipulationTool.estimate_pose_single_markers(
             corners_in, marker_length_m, calib.camera_matrix, calib.dist_coeffs
         )
         t = translation_vecs[0][0]
         x, y, z = t[0], t[1], t[2]
 
         if center:
-            x_sum = corners_in[0][0][0][0] + corners_in[0][0][1][0] + corners_in[0][0][2][0] + corners_in[0][0][3][0]
-            y_sum = corners_in[0][0][0][1] + corners_in[0][0][1][1] + corners_in[0][0][2][1] + corners_in[0][0][3][1]
-            x_avg = x_sum / 4
-            y_avg = y_sum / 4
+            x_avg, y_avg = corners_in[0, 0].mean(axis=0)
 
             fx = calib.camera_matrix[0, 0]
             fy = calib.camera_matrix[1, 1]
@@ -1,3 +1,4 @@
+import time
 from threading import Lock
 from typing import Optional
 
@@ -10,6 +11,7 @@ class PoseBuffer(Buffer):
         self.lock = Lock()
         self._pose3D: Optional[Pose3D] = None
         self._uav_pose3D: Optional[Pose3D] = None
+        self._poses_set_at = 0.0
 
     def set_value(self, pose: Pose3D) -> None:
         with self.lock:
@@ -19,6 +21,12 @@ class PoseBuffer(Buffer):
         with self.lock:
             self._uav_pose3D = uav_pose
 
+    def set_poses(self, pose: Optional[Pose3D], uav_pose: Optional[Pose3D]) -> None:
+        with self.lock:
+            self._pose3D = pose
+            self._uav_pose3D = uav_pose
+            self._poses_set_at = time.monotonic()
+
     def get_value(self) -> Pose3D:
         with self.lock:
             return self._pose3D
@@ -26,3 +34,10 @@ class PoseBuffer(Buffer):
     def get_uav_pose_value(self) -> Pose3D:
         with self.lock:
             return self._uav_pose3D
+
+    def get_fresh_uav_pose_value(self, max_age_s: float) -> Optional[Pose3D]:
+        """Return the UAV pose set by the last set_poses() call, or None if it is older than `max_age_s`."""
+        with self.lock:
+            if time.monotonic() - self._poses_set_at > max_age_s:
+                return None
+            return self._uav_pose3D
@@ -47,7 +47,8 @@ class _GazeboCameraNode(Node):
         if msg.encoding == "rgb8":
             frame = frame[:, :, ::-1]  # RGB -> BGR
 
-        return frame.copy()
+        # Keep the view on the message buffer: get_latest_frame() already hands out a contiguous copy.
+        return frame
 
     def wait_first_frame(self, timeout_sec: float) -> bool:
         return self._first_frame_event.wait(timeout=timeout_sec)
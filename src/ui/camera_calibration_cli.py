@@ -1,12 +1,6 @@
 import click
 from loguru import logger
 
-from application.camera_calibration_service import CameraCalibrationParameters, CameraCalibrationService
-from domain.models import TargetedMarker
-from infrastructure.persistence.configuration_models import CameraConfiguration
-from infrastructure.vision.opencv_gridboard_calibration_engine import GridBoardCalibrationConfig, GridBoardSpec
-from ui.common_functions import build_camera
-
 
 @click.command(context_settings={"help_option_names": ["-h", "--help"]})
 @click.option("-w", "markers_x", required=True, type=int, help="Markers X")
@@ -40,6 +34,13 @@ def main(
     height,
     fps,
 ):
+    # Imported here so that `--help` answers without loading OpenCV and the camera stacks.
+    from application.camera_calibration_service import CameraCalibrationParameters, CameraCalibrationService
+    from domain.models import TargetedMarker
+    from infrastructure.persistence.configuration_models import CameraConfiguration
+    from infrastructure.vision.opencv_gridboard_calibration_engine import GridBoardCalibrationConfig, GridBoardSpec
+    from ui.common_functions import build_camera
+
     camera_config = CameraConfiguration(
         use_picamera=picam,
         fps=fps,
@@ -72,7 +73,7 @@ def main(
     logger.info("Starting calibration...")
     calibration_report, calibration_filepath = camera_calibrator.calibrate()
 
-    logger.success(f"Calibration finished: calibration report saved to {calibration_filepath}")
+    logger.success("Calibration finished: calibration report saved to {}", calibration_filepath)
     calibration_report.show()
 
 
@@ -4,6 +4,7 @@ from domain.camera import Camera
 from domain.drone import Drone
 from domain.models import CalibrationData
 from infrastructure.camera.opencv_capture_adapter import OpenCVCamera
+from infrastructure.camera.threaded_camera import ThreadedCamera
 from infrastructure.communication.mavlink import (
     DroneMavlinkSerialConnector,
     DroneMavlinkUDPConnector,
@@ -16,6 +17,7 @@ def build_camera(
     camera_config: CameraConfiguration,
     calibration_data: Optional[CalibrationData] = None,
     use_simulated_cam: Optional[bool] = False,
+    threaded_capture: bool = False,
 ) -> Camera:
     if use_simulated_cam:
         if not camera_config.simulation_topic_name:
@@ -32,14 +34,19 @@ def build_camera(
     if camera_config.use_picamera:
         from infrastructure.camera.picamera_adapter import PiCameraAdapter
 
-        return PiCameraAdapter(width=camera_width, height=camera_height, fps=camera_config.fps)
+        camera = PiCameraAdapter(width=camera_width, height=camera_height, fps=camera_config.fps)
+    else:
+        camera = OpenCVCamera(
+            source=camera_config.id,
+            width=camera_width,
+            height=camera_height,
+            fps=camera_config.fps,
+        )
 
-    return OpenCVCamera(
-        source=camera_config.id,
-        width=camera_width,
-        height=camera_height,
-        fps=camera_config.fps,
-    )
+    if threaded_capture:
+        return ThreadedCamera(camera)
+
+    return camera
 
 
 def build_drone(drone_connection_config: DroneConnectionConfiguration) -> Drone:
@@ -47,6 +54,7 @@ def build_drone(drone_connection_config: DroneConnectionConfiguration) -> Drone:
         address=drone_connection_config.address,
         port=drone_connection_config.port,
         baud_rate=drone_connection_config.baud_rate,
+        timeout=drone_connection_config.timeout,
     )
     if drone_connection_config.use_serial:
         return DroneMavlinkSerialConnector(mavlink_params)
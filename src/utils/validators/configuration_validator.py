@@ -37,7 +37,8 @@ class ConfigurationValidator:
         "use_serial": bool,
         "address": str non-empty,
         "port": int in [1..65535] OR null,
-        "baud_rate": int>0
+        "baud_rate": int>0,
+        "timeout": float>0 OR null (optional, seconds; null/absent waits indefinitely)
       }
     }
     """
@@ -155,6 +156,10 @@ class ConfigurationValidator:
                 raise ValidationError("port must be in [1..65535]", "drone_connection.port")
             port = port_val
 
+        # timeout is optional: null or absent waits indefinitely for the autopilot
+        if dc.get("timeout") is not None:
+            self._req_number(dc, "timeout", "drone_connection", min_exclusive=0.0)
+
         # Coherence rules
         if use_serial:
             # pour Serial, port n’est généralement pas utilisé
@@ -179,7 +184,7 @@ class ConfigurationValidator:
                 )
             self._validate_host_like(address, "drone_connection.address")
 
-        self._no_extra_keys(dc, {"use_serial", "address", "port", "baud_rate"}, "drone_connection")
+        self._no_extra_keys(dc, {"use_serial", "address", "port", "baud_rate", "timeout"}, "drone_connection")
 
     # -------------------------
     # Helpers
@@ -0,0 +1,93 @@
+import io
+from types import SimpleNamespace
+
+import pytest
+from pymavlink.dialects.v20 import ardupilotmega
+
+import infrastructure.communication.mavlink.drone_mavlink_base as drone_mavlink_base
+from domain.models import Pose3D
+from infrastructure.communication.mavlink.drone_mavlink_udp_connector import DroneMavlinkUDPConnector
+from infrastructure.communication.mavlink.mavlink_connection_params import MavlinkConnectionParams
+
+TARGET_SIZE = (0.9, 0.9)
+CENTERED_POSE = Pose3D(x=320.0, y=240.0, z=5.0)
+MOVED_POSE = Pose3D(x=330.0, y=240.0, z=5.0)
+
+
+class FakeMav:
+    """Encodes messages with the real MAVLink dialect and records what is sent instead of writing it."""
+
+    def __init__(self):
+        self._mav = ardupilotmega.MAVLink(io.BytesIO())
+        self.encoded = 0
+        self.sent = []
+
+    def landing_target_encode(self, *args):
+        self.encoded += 1
+        return self._mav.landing_target_encode(*args)
+
+    def send(self, msg):
+        self._mav.send(msg)
+        self.sent.append((msg, msg.time_usec, msg.angle_x, msg.angle_y, msg.distance))
+
+
+class FakeClock:
+    def __init__(self, now_s: float = 100.0):
+        self.now_s = now_s
+
+    def __call__(self) -> float:
+        return self.now_s
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(drone_mavlink_base.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def drone():
+    drone = DroneMavlinkUDPConnector(MavlinkConnectionParams(address="127.0.0.1", port=14550))
+    drone.connection = SimpleNamespace(mav=FakeMav())
+    return drone
+
+
+def test_landing_target_message_is_encoded_once_and_reused(drone, clock):
+    drone.land_on_target(CENTERED_POSE, TARGET_SIZE)
+    clock.now_s += drone_mavlink_base.LANDING_TARGET_MIN_PERIOD_S
+    drone.land_on_target(MOVED_POSE, TARGET_SIZE)
+
+    mav = drone.connection.mav
+    assert mav.encoded == 1
+    assert len(mav.sent) == 2
+    assert mav.sent[0][0] is mav.sent[1][0]
+    assert mav.sent[0][2] == pytest.approx(0.0)
+    assert mav.sent[1][2] == pytest.approx(10 * drone_mavlink_base.X_ANGLE_PER_PX)
+    assert mav.sent[1][1] >= mav.sent[0][1]
+
+
+def test_unchanged_target_is_suppressed_within_the_minimum_period(drone, clock):
+    for _ in range(10):
+        drone.land_on_target(CENTERED_POSE, TARGET_SIZE)
+        clock.now_s += 0.001
+
+    assert len(drone.connection.mav.sent) == 1
+
+
+def test_moved_target_is_sent_immediately(drone, clock):
+    drone.land_on_target(CENTERED_POSE, TARGET_SIZE)
+    clock.now_s += 0.001
+    drone.land_on_target(MOVED_POSE, TARGET_SIZE)
+
+    assert len(drone.connection.mav.sent) == 2
+
+
+def test_unchanged_target_is_resent_after_the_minimum_period(drone, clock):
+    drone.land_on_target(CENTERED_POSE, TARGET_SIZE)
+    clock.now_s += drone_mavlink_base.LANDING_TARGET_MIN_PERIOD_S / 2
+    drone.land_on_target(CENTERED_POSE, TARGET_SIZE)
+    clock.now_s += drone_mavlink_base.LANDING_TARGET_MIN_PERIOD_S / 2
+    drone.land_on_target(CENTERED_POSE, TARGET_SIZE)
+
+    assert len(drone.connection.mav.sent) == 2
@@ -0,0 +1,53 @@
+import threading
+import time
+
+import numpy as np
+
+from infrastructure.camera.frame_buffer import FrameBuffer
+
+
+def test_wait_for_value_returns_the_newer_value():
+    buffer = FrameBuffer()
+    buffer.set_value(np.zeros((2, 2)), {"status": 1})
+
+    version, frame, metadata = buffer.wait_for_value(newer_than=0, timeout=1.0)
+
+    assert version == 1
+    assert frame.shape == (2, 2)
+    assert metadata == {"status": 1}
+
+
+def test_wait_for_value_keeps_the_version_on_timeout():
+    buffer = FrameBuffer()
+    buffer.set_value(np.zeros((2, 2)))
+
+    version, _frame, _metadata = buffer.wait_for_value(newer_than=1, timeout=0.05)
+
+    assert version == 1
+
+
+def test_wait_for_value_is_woken_up_by_set_value():
+    buffer = FrameBuffer()
+    threading.Timer(0.05, buffer.set_value, args=(np.ones((2, 2)),)).start()
+
+    started_at = time.monotonic()
+    version, frame, _metadata = buffer.wait_for_value(newer_than=0, timeout=5.0)
+
+    assert version == 1
+    assert frame[0, 0] == 1
+    assert time.monotonic() - started_at < 1.0
+
+
+def test_close_releases_current_and_later_waiters():
+    buffer = FrameBuffer()
+    threading.Timer(0.05, buffer.close).start()
+
+    started_at = time.monotonic()
+    version, frame, _metadata = buffer.wait_for_value(newer_than=0, timeout=5.0)
+
+    assert (version, frame) == (0, None)
+    assert time.monotonic() - started_at < 1.0
+
+    started_at = time.monotonic()
+    buffer.wait_for_value(newer_than=0, timeout=5.0)
+    assert time.monotonic() - started_at < 0.5
@@ -0,0 +1,122 @@
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+import pytest
+
+import infrastructure.camera.threaded_camera as threaded_camera
+from domain.camera import Camera
+from infrastructure.camera.threaded_camera import ThreadedCamera
+
+
+class FakeCamera(Camera):
+    """Returns frames filled with 1, 2, 3... Can stall before a given frame or fail after a given count."""
+
+    def __init__(
+        self,
+        fail_after: Optional[int] = None,
+        stall_before: Optional[int] = None,
+        stall_s: float = 0.0,
+        period_s: float = 0.005,
+    ):
+        self.fail_after = fail_after
+        self.stall_before = stall_before
+        self.stall_s = stall_s
+        self.period_s = period_s
+        self.captured = 0
+        self.closed = threading.Event()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed.set()
+
+    def get_frame(self) -> np.ndarray:
+        if self.fail_after is not None and self.captured >= self.fail_after:
+            raise OSError("camera unplugged")
+        if self.stall_before is not None and self.captured + 1 == self.stall_before:
+            self.closed.wait(self.stall_s)
+        else:
+            time.sleep(self.period_s)
+        self.captured += 1
+        return np.full((2, 2), self.captured, dtype=np.int32)
+
+    def get_fps(self) -> int:
+        return 30
+
+
+@pytest.fixture
+def short_stall_period(monkeypatch):
+    monkeypatch.setattr(threaded_camera, "FRAME_MAX_WAITING_PERIOD_S", 0.05)
+
+
+def test_each_frame_is_handed_out_once_in_order():
+    camera = ThreadedCamera(FakeCamera())
+    camera.open()
+    try:
+        values = [int(camera.get_frame()[0, 0]) for _ in range(5)]
+    finally:
+        camera.close()
+
+    assert values == sorted(set(values))
+
+
+def test_stall_keeps_waiting_for_the_next_frame(short_stall_period):
+    camera = ThreadedCamera(FakeCamera(stall_before=2, stall_s=0.3))
+    camera.open()
+    try:
+        first = camera.get_frame()
+        second = camera.get_frame()
+    finally:
+        camera.close()
+
+    assert first[0, 0] == 1
+    assert second[0, 0] == 2
+
+
+def test_capture_error_is_raised_without_waiting():
+    camera = ThreadedCamera(FakeCamera(fail_after=0))
+    camera.open()
+    try:
+        started_at = time.monotonic()
+        with pytest.raises(RuntimeError) as error:
+            camera.get_frame()
+        assert time.monotonic() - started_at < 1.0
+        assert isinstance(error.value.__cause__, OSError)
+
+        started_at = time.monotonic()
+        with pytest.raises(RuntimeError):
+            camera.get_frame()
+        assert time.monotonic() - started_at < 0.1
+    finally:
+        camera.close()
+
+
+def test_open_restarts_capture_after_an_error():
+    fake_camera = FakeCamera(fail_after=0)
+    camera = ThreadedCamera(fake_camera)
+    camera.open()
+    with pytest.raises(RuntimeError):
+        camera.get_frame()
+
+    fake_camera.fail_after = None
+    camera.open()
+    try:
+        assert camera.get_frame()[0, 0] == 1
+    finally:
+        camera.close()
+
+
+def test_close_releases_a_blocked_consumer(short_stall_period):
+    camera = ThreadedCamera(FakeCamera(stall_before=1, stall_s=1.0))
+    camera.open()
+    closer = threading.Timer(0.1, camera.close)
+    closer.start()
+
+    started_at = time.monotonic()
+    with pytest.raises(RuntimeError, match="closed"):
+        camera.get_frame()
+    assert time.monotonic() - started_at < 0.5
+    closer.join()